@@ -0,0 +1,34 @@
+"""Add indexes for filter predicates
+
+Revision ID: 2e4d8b10658e
+Revises: fda6f6a399cf
+Create Date: 2026-10-14 13:05:12.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e4d8b10658e'
+down_revision: Union[str, Sequence[str], None] = 'fda6f6a399cf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_analyzed_strings_length'), 'analyzed_strings', ['length'], unique=False)
+    op.create_index(op.f('ix_analyzed_strings_word_count'), 'analyzed_strings', ['word_count'], unique=False)
+    op.create_index('ix_analyzed_strings_palindromes', 'analyzed_strings', ['is_palindrome'], unique=False, postgresql_where=sa.text('is_palindrome'))
+    op.create_index('ix_analyzed_strings_character_frequency_map', 'analyzed_strings', ['character_frequency_map'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_analyzed_strings_character_frequency_map', table_name='analyzed_strings', postgresql_using='gin')
+    op.drop_index('ix_analyzed_strings_palindromes', table_name='analyzed_strings', postgresql_where=sa.text('is_palindrome'))
+    op.drop_index(op.f('ix_analyzed_strings_word_count'), table_name='analyzed_strings')
+    op.drop_index(op.f('ix_analyzed_strings_length'), table_name='analyzed_strings')
@@ -0,0 +1,28 @@
+"""Add freq_ascii histogram column
+
+Revision ID: 7c1f3a9e52d4
+Revises: 2e4d8b10658e
+Create Date: 2026-10-14 13:18:40.902311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f3a9e52d4'
+down_revision: Union[str, Sequence[str], None] = '2e4d8b10658e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('analyzed_strings', sa.Column('freq_ascii', sa.LargeBinary(length=1024), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('analyzed_strings', 'freq_ascii')
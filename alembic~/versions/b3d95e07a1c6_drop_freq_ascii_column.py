@@ -0,0 +1,28 @@
+"""Drop freq_ascii histogram column
+
+Revision ID: b3d95e07a1c6
+Revises: 7c1f3a9e52d4
+Create Date: 2026-10-14 16:42:07.518304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3d95e07a1c6'
+down_revision: Union[str, Sequence[str], None] = '7c1f3a9e52d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_column('analyzed_strings', 'freq_ascii')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('analyzed_strings', sa.Column('freq_ascii', sa.LargeBinary(length=1024), nullable=True))
@@ -1,29 +1,116 @@
 # app/analyzer.py
 import hashlib
 from collections import Counter
+from functools import lru_cache
+from typing import Dict, List, Union
 
-def analyze_string(input_string: str) -> dict:
+import numpy as np
+
+# Results are memoized per input string; very long strings bypass the
+# cache so that it cannot pin large amounts of memory.
+ANALYZE_CACHE_SIZE = 4096
+ANALYZE_CACHE_MAX_LENGTH = 4096
+
+# Number of character pairs compared from the ends before lowercasing
+_PALINDROME_PROBES = 8
+
+# Below this many bytes, lowercasing and comparing the whole string is
+# cheaper than probing the ends first
+_PALINDROME_PROBE_MIN_LENGTH = 1024
+
+# Below this many bytes, Counter beats numpy's per-call overhead
+_BINCOUNT_MIN_LENGTH = 256
+
+def _is_palindrome(normalized_string: Union[str, bytes]) -> bool:
     """
-    Computes all required properties for a given string.
+    Compares the first half against the reversed second half, so only two
+    half-length slices are built instead of a full reversed copy.
+    """
+    half = len(normalized_string) // 2
+    return normalized_string[:half] == normalized_string[:-half - 1:-1]
+
+def _ends_differ(raw: bytes) -> bool:
+    """
+    Compares a few byte pairs from both ends of an ASCII string, ignoring
+    case, so most non-palindromes are rejected without lowercasing a copy.
+    Returning False means no difference was found, not that it is a palindrome.
+    """
+    # Setting bit 0x20 lowercases A-Z; if two bytes still differ after it,
+    # they differ after lower() as well.
+    for i in range(min(_PALINDROME_PROBES, len(raw) // 2)):
+        if raw[i] | 0x20 != raw[-1 - i] | 0x20:
+            return True
+    return False
+
+def _count_ascii(input_string: str, raw: bytes) -> Dict[str, int]:
+    """
+    Returns the character frequency map of an ASCII string, counting its
+    encoded bytes with numpy when the string is long enough to pay off.
+    """
+    if len(raw) >= _BINCOUNT_MIN_LENGTH:
+        counts = np.bincount(np.frombuffer(raw, dtype=np.uint8), minlength=256)
+        return {chr(byte): int(counts[byte]) for byte in np.flatnonzero(counts)}
+    return dict(Counter(input_string))
+
+def _analyze(input_string: str) -> dict:
+    """
+    Uncached implementation of analyze_string.
     """
-    
     length = len(input_string)
-    normalized_string = input_string.lower()
-    is_palindrome = normalized_string == normalized_string[::-1]
 
-    unique_characters = len(set(input_string))
-    
+    # Encode once and, for ASCII input, compute everything from the bytes:
+    # lower() then only maps A-Z and never consults the Unicode case
+    # tables, and long strings are counted as bytes.
+    if input_string.isascii():
+        raw = input_string.encode('ascii')
+        if len(raw) >= _PALINDROME_PROBE_MIN_LENGTH and _ends_differ(raw):
+            is_palindrome = False
+        else:
+            is_palindrome = _is_palindrome(raw.lower())
+        character_frequency_map = _count_ascii(input_string, raw)
+    else:
+        raw = input_string.encode('utf-8')
+        is_palindrome = _is_palindrome(input_string.lower())
+        character_frequency_map = dict(Counter(input_string)) # Convert Counter to plain dict
+
     word_count = len(input_string.split())
 
-    hash_object = hashlib.sha256(input_string.encode('utf-8'))
+    hash_object = hashlib.sha256(raw)
     sha256_hash = hash_object.hexdigest()
-    
-    character_frequency_map = Counter(input_string)
+
+    # The frequency map's keys are exactly the distinct characters,
+    # so this avoids a separate set() pass over the string.
+    unique_characters = len(character_frequency_map)
     return {
         "length": length,
         "is_palindrome": is_palindrome,
         "unique_characters": unique_characters,
         "word_count": word_count,
         "sha256_hash": sha256_hash,
-        "character_frequency_map": dict(character_frequency_map) # Convert Counter to plain dict
-    }
\ No newline at end of file
+        "character_frequency_map": character_frequency_map
+    }
+
+_analyze_cached = lru_cache(maxsize=ANALYZE_CACHE_SIZE)(_analyze)
+
+def analyze_string(input_string: str) -> dict:
+    """
+    Computes all required properties for a given string.
+    """
+    if len(input_string) > ANALYZE_CACHE_MAX_LENGTH:
+        return _analyze(input_string)
+
+    properties = _analyze_cached(input_string)
+    # Hand out copies so callers cannot mutate the cached result
+    return {**properties, "character_frequency_map": dict(properties["character_frequency_map"])}
+
+def analyze_cache_info():
+    """
+    Returns the hit/miss statistics of the analyze_string cache.
+    """
+    return _analyze_cached.cache_info()
+
+def analyze_many(strings: List[str]) -> List[dict]:
+    """
+    Computes the properties of several strings, in input order.
+    """
+    return [analyze_string(s) for s in strings]
@@ -0,0 +1,101 @@
+# app/cache.py
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    A serialized response body and its ETag.
+    """
+    body: bytes
+    etag: str
+    expires_at: float
+
+    def matches(self, if_none_match: str) -> bool:
+        """
+        Whether an If-None-Match header value names this entry. Uses the
+        weak comparison RFC 9110 requires for If-None-Match, so W/ tags and
+        "*" match too.
+        """
+        etag = self.etag[2:] if self.etag.startswith("W/") else self.etag
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag == "*" or tag == etag:
+                return True
+        return False
+
+
+class ResponseCache:
+    """
+    In-process LRU cache of serialized GET responses with a fixed TTL.
+
+    Memory is bounded by ``max_bytes`` across all entries; bodies larger
+    than ``max_entry_bytes`` are never stored.
+
+    The cache is per process, so it is only coherent when a single worker
+    handles all writes; every write clears it. Each clear bumps
+    ``generation`` so a response computed before a write is not stored
+    after it.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, max_bytes: int, max_entry_bytes: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: Hashable, generation: int, body: bytes) -> CacheEntry:
+        """
+        Stores a body computed while the cache was at ``generation``; the
+        entry is returned but not kept if a write has happened since or the
+        body exceeds ``max_entry_bytes``.
+        """
+        entry = CacheEntry(
+            body=body,
+            etag='"%s"' % hashlib.sha256(body).hexdigest(),
+            expires_at=time.monotonic() + self.ttl,
+        )
+        if generation != self.generation or len(body) > self.max_entry_bytes:
+            return entry
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self.total_bytes += len(body)
+        while len(self._entries) > self.maxsize or self.total_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+        return entry
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self.total_bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        self.total_bytes -= len(self._entries.pop(key).body)
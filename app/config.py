@@ -6,4 +6,14 @@ class Settings(BaseSettings):
     
     DATABASE_URL: str
 
+    # Connection pool sizing; keep pool_size + max_overflow below the
+    # database's connection limit across all workers.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    # asyncpg prepared statement cache; set to 0 behind a transaction-mode
+    # pooler such as pgbouncer, which cannot share prepared statements.
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+
 settings = Settings()
\ No newline at end of file
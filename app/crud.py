@@ -1,42 +1,106 @@
 # app/crud.py
+import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
-from typing import Optional, List, Dict, Any
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import delete, func, Row
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 
 from . import models, schemas, analyzer
 
+# Inputs larger than this (in characters) are analyzed in a worker thread so
+# the event loop keeps serving other requests; hashlib releases the GIL while
+# hashing large buffers.
+_OFFLOAD_THRESHOLD = 65536
+
+# Columns selected by the list endpoints: rows come back as plain tuples,
+# which skips ORM identity-map bookkeeping and object hydration.
+_STRING_COLUMNS = (
+    models.AnalyzedString.sha256_hash,
+    models.AnalyzedString.value,
+    models.AnalyzedString.length,
+    models.AnalyzedString.is_palindrome,
+    models.AnalyzedString.unique_characters,
+    models.AnalyzedString.word_count,
+    models.AnalyzedString.created_at,
+)
+
+# Columns returned by INSERT ... RETURNING
+_RETURNED_COLUMNS = _STRING_COLUMNS + (models.AnalyzedString.character_frequency_map,)
+
+def _string_row(value: str, properties: dict) -> Dict[str, Any]:
+    return {
+        "value": value,
+        "sha256_hash": properties["sha256_hash"],
+        "length": properties["length"],
+        "is_palindrome": properties["is_palindrome"],
+        "unique_characters": properties["unique_characters"],
+        "word_count": properties["word_count"],
+        "character_frequency_map": properties["character_frequency_map"]
+    }
+
+def _insert_new_strings(rows: List[Dict[str, Any]]):
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING the created rows, so duplicates
+    are skipped in the same round trip instead of failing the transaction.
+    """
+    return (
+        pg_insert(models.AnalyzedString)
+        .values(rows)
+        .on_conflict_do_nothing()
+        .returning(*_RETURNED_COLUMNS)
+    )
+
 async def create_analyzed_string(
     db: AsyncSession, 
     string_data: schemas.StringCreate
-) -> Optional[models.AnalyzedString]:
+) -> Optional[Row]:
     """
     Analyzes a string, creates a new record in the database,
-    and returns the new object.
+    and returns the new row.
     
     Returns None if a string with the same value already exists.
     """
-    properties = analyzer.analyze_string(string_data.value)
-
-    db_string = models.AnalyzedString(
-        value=string_data.value,
-        sha256_hash=properties["sha256_hash"],
-        length=properties["length"],
-        is_palindrome=properties["is_palindrome"],
-        unique_characters=properties["unique_characters"],
-        word_count=properties["word_count"],
-        character_frequency_map=properties["character_frequency_map"]
+    if len(string_data.value) > _OFFLOAD_THRESHOLD:
+        properties = await asyncio.to_thread(analyzer.analyze_string, string_data.value)
+    else:
+        properties = analyzer.analyze_string(string_data.value)
+    query = _insert_new_strings([_string_row(string_data.value, properties)])
+
+    result = await db.execute(query)
+    row = result.one_or_none()
+    await db.commit()
+    return row
+
+async def create_analyzed_strings(
+    db: AsyncSession,
+    bulk_data: schemas.BulkStringCreate
+) -> Tuple[List[Row], List[str]]:
+    """
+    Analyzes and stores several strings with a single INSERT.
+
+    Values that already exist are skipped; repeats within the request are
+    stored once. Returns the created rows and the skipped values.
+    """
+    values = list(dict.fromkeys(bulk_data.values))
+    if sum(map(len, values)) > _OFFLOAD_THRESHOLD:
+        properties_list = await asyncio.to_thread(analyzer.analyze_many, values)
+    else:
+        properties_list = analyzer.analyze_many(values)
+
+    rows = [
+        _string_row(value, properties)
+        for value, properties in zip(values, properties_list)
+    ]
+
+    result = await db.execute(_insert_new_strings(rows))
+    created = {row.value: row for row in result.all()}
+    await db.commit()
+
+    return (
+        [created[v] for v in values if v in created],
+        [v for v in values if v not in created]
     )
-    
-    db.add(db_string)
-    try:
-        await db.commit()
-        await db.refresh(db_string)
-        return db_string
-    except IntegrityError:
-        await db.rollback()
-        return None
 
 async def get_string_by_value(
     db: AsyncSession, 
@@ -54,22 +118,22 @@ async def delete_string_by_value(db: AsyncSession, string_value: str) -> bool:
     Deletes a string by its 'value'. 
     Returns True if deleted, False if not found.
     """
-    db_string = await get_string_by_value(db, string_value)
-    
-    if db_string:
-        await db.delete(db_string)
-        await db.commit()
-        return True
-    return False
+    query = (
+        delete(models.AnalyzedString)
+        .where(models.AnalyzedString.value == string_value)
+        .returning(models.AnalyzedString.sha256_hash)
+    )
+    result = await db.execute(query)
+    await db.commit()
+    return result.scalar_one_or_none() is not None
 
-async def get_filtered_strings(
-    db: AsyncSession, 
-    filters: Dict[str, Any]
-) -> List[models.AnalyzedString]:
-    """
-    Fetches a list of strings based on applied filters.
-    """
-    query = select(models.AnalyzedString)
+def _filtered_strings_query(filters: Dict[str, Any], include_frequency: bool):
+    # The JSONB frequency map is usually the largest column, so it is only
+    # fetched when the caller asks for it.
+    columns = _STRING_COLUMNS
+    if include_frequency:
+        columns += (models.AnalyzedString.character_frequency_map,)
+    query = select(*columns)
     
     # Applied filters dynamically
     if filters.get("is_palindrome") is not None:
@@ -88,5 +152,29 @@ async def get_filtered_strings(
         char = filters["contains_character"]
         query = query.where(models.AnalyzedString.character_frequency_map.has_key(char))
 
-    result = await db.execute(query)
-    return result.scalars().all()
\ No newline at end of file
+    return query
+
+async def get_filtered_strings(
+    db: AsyncSession, 
+    filters: Dict[str, Any],
+    include_frequency: bool = False
+) -> List[Row]:
+    """
+    Fetches a list of strings based on applied filters, as column rows.
+    character_frequency_map is only selected if include_frequency is set.
+    """
+    result = await db.execute(_filtered_strings_query(filters, include_frequency))
+    return result.all()
+
+async def iter_filtered_strings(
+    db: AsyncSession,
+    filters: Dict[str, Any],
+    include_frequency: bool = False
+) -> AsyncIterator[Row]:
+    """
+    Streams strings matching the applied filters from a server-side cursor,
+    so the full result set is never held in memory.
+    """
+    result = await db.stream(_filtered_strings_query(filters, include_frequency))
+    async for row in result:
+        yield row
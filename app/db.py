@@ -6,9 +6,14 @@ from app.config import settings
 # Created the async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
     connect_args={
-        "command_timeout": 60
+        "command_timeout": 60,
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
     }
 )
 
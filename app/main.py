@@ -1,25 +1,168 @@
 # app/main.py
-from fastapi import FastAPI, Depends, HTTPException, status, Query
+import hashlib
+import logging
+import ssl
+import time
+import orjson
+from fastapi import FastAPI, Depends, HTTPException, Request, status, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List, Dict, Any
-from . import crud, models, schemas, parser 
+from typing import Optional, List, Dict, Any, AsyncIterator, Literal, Tuple, Union
+from . import analyzer, crud, models, schemas, parser 
+from .cache import CacheEntry, ResponseCache
 from .db import get_db, engine, Base
 
+# uvicorn only configures its own loggers, so log through its error logger
+# to have startup messages reach the console.
+logger = logging.getLogger("uvicorn.error")
+
+# Hashing self-test: 1 MiB should comfortably clear 1 GiB/s when hashlib's
+# OpenSSL backend uses the SHA-NI / ARMv8 SHA2 assembly kernels.
+_SELF_TEST_SIZE = 1024 * 1024
+_SELF_TEST_MIN_THROUGHPUT = 1024 ** 3
+
+# Serialized GET responses, cleared on every write. Bodies over 256 KiB
+# (large result sets) are not cached, and the cache holds at most 32 MiB.
+response_cache = ResponseCache(
+    maxsize=1024,
+    ttl=60,
+    max_bytes=32 * 1024 * 1024,
+    max_entry_bytes=256 * 1024
+)
+
 # Create FastAPI app
-app = FastAPI(title="String Analyzer Service")
+app = FastAPI(title="String Analyzer Service", default_response_class=ORJSONResponse)
+
+def _check_sha256_backend() -> None:
+    """
+    Logs the OpenSSL build behind hashlib and a one-shot SHA-256 throughput
+    measurement, warning if it looks like the portable C fallback.
+    """
+    if hashlib.sha256().name != "sha256":
+        raise RuntimeError("hashlib.sha256 is not backed by a SHA-256 implementation.")
+
+    buffer = b"\x00" * _SELF_TEST_SIZE
+    start = time.perf_counter()
+    hashlib.sha256(buffer).hexdigest()
+    elapsed = time.perf_counter() - start
+    throughput = _SELF_TEST_SIZE / elapsed if elapsed > 0 else float("inf")
+
+    logger.info(
+        "hashlib backend: %s, sha256 self-test: %.2f GiB/s",
+        ssl.OPENSSL_VERSION,
+        throughput / 1024 ** 3,
+    )
+    if throughput < _SELF_TEST_MIN_THROUGHPUT:
+        logger.warning(
+            "sha256 throughput is below 1 GiB/s; OpenSSL may be built "
+            "without assembly or have SHA extensions masked via OPENSSL_ia32cap."
+        )
+
+def _to_response(db_string: Union[models.AnalyzedString, Row]) -> schemas.StringResponse:
+    return schemas.StringResponse(
+        id=db_string.sha256_hash,
+        value=db_string.value,
+        properties=schemas.StringProperties(
+            length=db_string.length,
+            is_palindrome=db_string.is_palindrome,
+            unique_characters=db_string.unique_characters,
+            word_count=db_string.word_count,
+            sha256_hash=db_string.sha256_hash,
+            character_frequency_map=db_string.character_frequency_map
+        ),
+        created_at=db_string.created_at
+    )
+
+def _row_to_payload(row: Row) -> Dict[str, Any]:
+    """
+    Shapes a column row from the list queries like StringResponse, without
+    building Pydantic models for data that comes straight from the database.
+    The frequency map is null unless the query selected it.
+    """
+    character_frequency_map = row._mapping.get("character_frequency_map")
+
+    return {
+        "id": row.sha256_hash,
+        "value": row.value,
+        "properties": {
+            "length": row.length,
+            "is_palindrome": row.is_palindrome,
+            "unique_characters": row.unique_characters,
+            "word_count": row.word_count,
+            "sha256_hash": row.sha256_hash,
+            "character_frequency_map": character_frequency_map,
+        },
+        "created_at": row.created_at,
+    }
+
+# OPT_UTC_Z renders UTC timestamps with a "Z" suffix, as Pydantic does.
+# Every hand-serialized body (list, NDJSON, cached single string) goes
+# through these options so created_at has one format across endpoints.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+def _json_body(content: Dict[str, Any]) -> bytes:
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+def _filters_key(filters: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted(filters.items()))
+
+def _cached_response(request: Request, entry: CacheEntry) -> Response:
+    """
+    Serves a cached body, or 304 Not Modified if the client already has it.
+    """
+    if entry.matches(request.headers.get("if-none-match", "")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": entry.etag})
+    return Response(entry.body, media_type="application/json", headers={"ETag": entry.etag})
+
+async def _ndjson_lines(rows: AsyncIterator[Row]) -> AsyncIterator[bytes]:
+    async for row in rows:
+        yield orjson.dumps(_row_to_payload(row), option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+
+def _ndjson_response(rows: AsyncIterator[Row]) -> StreamingResponse:
+    return StreamingResponse(_ndjson_lines(rows), media_type="application/x-ndjson")
 
 @app.on_event("startup")
 async def startup():
+    _check_sha256_backend()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+@app.get(
+    "/metrics",
+    response_model=schemas.MetricsResponse,
+    summary="Get in-process cache statistics"
+)
+async def get_metrics():
+    """
+    Report hit/miss counters for the in-process analysis and response caches.
+    """
+    info = analyzer.analyze_cache_info()
+    return schemas.MetricsResponse(
+        analyze_cache=schemas.CacheStats(
+            hits=info.hits,
+            misses=info.misses,
+            size=info.currsize,
+            maxsize=info.maxsize
+        ),
+        response_cache=schemas.CacheStats(
+            hits=response_cache.hits,
+            misses=response_cache.misses,
+            size=len(response_cache),
+            maxsize=response_cache.maxsize
+        )
+    )
+
 @app.get(
     "/strings/filter-by-natural-language",
     response_model=schemas.NLFilterResponse,
     summary="Get strings using a natural language query"
 )
 async def get_strings_by_natural_language(
+    request: Request,
     query: str,
+    response_format: Literal["list", "ndjson"] = Query("list", alias="format"),
+    include: Optional[Literal["frequency"]] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -31,6 +174,10 @@ async def get_strings_by_natural_language(
     - "palindromic strings that contain the first vowel"
     - "strings containing the letter z"
 
+    Pass **format=ndjson** to stream matching strings one JSON object per line,
+    and **include=frequency** to return each string's character_frequency_map.
+    List responses carry an **ETag** and honour **If-None-Match**.
+
     Raises **400 Bad Request** if the query cannot be parsed.
     """
 
@@ -42,34 +189,32 @@ async def get_strings_by_natural_language(
             detail="Unable to parse natural language query."
         )
 
-    strings_list = await crud.get_filtered_strings(db, parsed_filters)
-
-    response_data = []
-    for db_string in strings_list:
-        response_data.append(schemas.StringResponse(
-            id=db_string.sha256_hash,
-            value=db_string.value,
-            properties=schemas.StringProperties(
-                length=db_string.length,
-                is_palindrome=db_string.is_palindrome,
-                unique_characters=db_string.unique_characters,
-                word_count=db_string.word_count,
-                sha256_hash=db_string.sha256_hash,
-                character_frequency_map=db_string.character_frequency_map
-            ),
-            created_at=db_string.created_at
-        ))
-
-    interpreted_query = schemas.NLFilterInterpretedQuery(
-        original=query,
-        parsed_filters=schemas.NLFilterParsed(**parsed_filters)
-    )
+    include_frequency = include == "frequency"
 
-    return schemas.NLFilterResponse(
-        data=response_data,
-        count=len(response_data),
-        interpreted_query=interpreted_query
-    )
+    if response_format == "ndjson":
+        return _ndjson_response(crud.iter_filtered_strings(db, parsed_filters, include_frequency))
+
+    # Keyed on validated inputs, so unknown or re-spelled query parameters
+    # cannot create extra entries; the original query is echoed in the body.
+    cache_key = ("nl", query, _filters_key(parsed_filters), include_frequency)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        generation = response_cache.generation
+        rows = await crud.get_filtered_strings(db, parsed_filters, include_frequency)
+        response_data = [_row_to_payload(row) for row in rows]
+
+        interpreted_query = schemas.NLFilterInterpretedQuery(
+            original=query,
+            parsed_filters=schemas.NLFilterParsed(**parsed_filters)
+        )
+
+        entry = response_cache.set(cache_key, generation, _json_body({
+            "data": response_data,
+            "count": len(response_data),
+            "interpreted_query": interpreted_query.model_dump()
+        }))
+
+    return _cached_response(request, entry)
 
 
 @app.post(
@@ -97,18 +242,35 @@ async def create_string(
             detail="String already exists in the system."
         )
     
-    return schemas.StringResponse(
-        id=db_string.sha256_hash,
-        value=db_string.value,
-        properties=schemas.StringProperties(
-            length=db_string.length,
-            is_palindrome=db_string.is_palindrome,
-            unique_characters=db_string.unique_characters,
-            word_count=db_string.word_count,
-            sha256_hash=db_string.sha256_hash,
-            character_frequency_map=db_string.character_frequency_map
-        ),
-        created_at=db_string.created_at
+    response_cache.clear()
+    return _to_response(db_string)
+
+@app.post(
+    "/strings/bulk",
+    response_model=schemas.BulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Analyze and store several strings at once"
+)
+async def create_strings_bulk(
+    bulk_data: schemas.BulkStringCreate,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Analyze several strings and store them in a single transaction.
+
+    - **values**: The strings to be analyzed.
+
+    Strings that already exist are skipped and listed in **skipped**.
+    """
+    db_strings, skipped = await crud.create_analyzed_strings(db=db, bulk_data=bulk_data)
+    if db_strings:
+        response_cache.clear()
+    response_data = [_to_response(db_string) for db_string in db_strings]
+
+    return schemas.BulkCreateResponse(
+        data=response_data,
+        count=len(response_data),
+        skipped=skipped
     )
 
 @app.get(
@@ -116,34 +278,34 @@ async def create_string(
     response_model=schemas.StringResponse,
     summary="Get a specific string by its value"
 )
-async def get_string(string_value: str, db: AsyncSession = Depends(get_db)):
+async def get_string(
+    request: Request,
+    string_value: str,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Retrieve the analysis properties for a single string.
     
     - **string_value**: The exact string to retrieve.
     
+    The response carries an **ETag** and honours **If-None-Match**.
     Raises **404 Not Found** if the string does not exist.
     """
-    db_string = await crud.get_string_by_value(db, string_value)
-    if db_string is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="String does not exist in the system."
-        )
-        
-    return schemas.StringResponse(
-        id=db_string.sha256_hash,
-        value=db_string.value,
-        properties=schemas.StringProperties(
-            length=db_string.length,
-            is_palindrome=db_string.is_palindrome,
-            unique_characters=db_string.unique_characters,
-            word_count=db_string.word_count,
-            sha256_hash=db_string.sha256_hash,
-            character_frequency_map=db_string.character_frequency_map
-        ),
-        created_at=db_string.created_at
-    )
+    cache_key = ("string", string_value)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        generation = response_cache.generation
+        db_string = await crud.get_string_by_value(db, string_value)
+        if db_string is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="String does not exist in the system."
+            )
+
+        body = _json_body(_to_response(db_string).model_dump())
+        entry = response_cache.set(cache_key, generation, body)
+
+    return _cached_response(request, entry)
 
 
 
@@ -153,11 +315,14 @@ async def get_string(string_value: str, db: AsyncSession = Depends(get_db)):
     summary="Get all strings with optional filters"
 )
 async def get_all_strings(
+    request: Request,
     is_palindrome: Optional[bool] = Query(None),
     min_length: Optional[int] = Query(None, ge=0),
     max_length: Optional[int] = Query(None, ge=0),
     word_count: Optional[int] = Query(None, ge=0),
     contains_character: Optional[str] = Query(None, min_length=1, max_length=1),
+    response_format: Literal["list", "ndjson"] = Query("list", alias="format"),
+    include: Optional[Literal["frequency"]] = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -168,6 +333,12 @@ async def get_all_strings(
     - **max_length**: Filter for strings with length <= value.
     - **word_count**: Filter for strings with an exact word count.
     - **contains_character**: Filter for strings containing a specific character.
+    - **format**: `list` (default) for a JSON envelope, or `ndjson` to stream
+      matching strings one JSON object per line.
+    - **include**: `frequency` to return each string's character_frequency_map,
+      which is left out (null) by default.
+
+    List responses carry an **ETag** and honour **If-None-Match**.
     """
     
     filters_applied = {
@@ -178,30 +349,25 @@ async def get_all_strings(
         "contains_character": contains_character
     }
     active_filters = {k: v for k, v in filters_applied.items() if v is not None}
+    include_frequency = include == "frequency"
     
-    strings_list = await crud.get_filtered_strings(db, active_filters)
-    
-    response_data = []
-    for db_string in strings_list:
-        response_data.append(schemas.StringResponse(
-            id=db_string.sha256_hash,
-            value=db_string.value,
-            properties=schemas.StringProperties(
-                length=db_string.length,
-                is_palindrome=db_string.is_palindrome,
-                unique_characters=db_string.unique_characters,
-                word_count=db_string.word_count,
-                sha256_hash=db_string.sha256_hash,
-                character_frequency_map=db_string.character_frequency_map
-            ),
-            created_at=db_string.created_at
-        ))
-        
-    return schemas.FilterResponse(
-        data=response_data,
-        count=len(response_data),
-        filters_applied=active_filters
-    )
+    if response_format == "ndjson":
+        return _ndjson_response(crud.iter_filtered_strings(db, active_filters, include_frequency))
+
+    cache_key = ("strings", _filters_key(active_filters), include_frequency)
+    entry = response_cache.get(cache_key)
+    if entry is None:
+        generation = response_cache.generation
+        rows = await crud.get_filtered_strings(db, active_filters, include_frequency)
+        response_data = [_row_to_payload(row) for row in rows]
+
+        entry = response_cache.set(cache_key, generation, _json_body({
+            "data": response_data,
+            "count": len(response_data),
+            "filters_applied": active_filters
+        }))
+
+    return _cached_response(request, entry)
 
 @app.delete(
     "/strings/{string_value}", 
@@ -223,4 +389,5 @@ async def delete_string(string_value: str, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="String does not exist in the system."
         )
+    response_cache.clear()
     return None
\ No newline at end of file
@@ -1,5 +1,5 @@
 # app/models.py
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, func
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, Index, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column
 from app.db import Base
@@ -11,10 +11,10 @@ class AnalyzedString(Base):
 
     value = mapped_column(Text, unique=True, index=True, nullable=False)
     
-    length = mapped_column(Integer, nullable=False)
+    length = mapped_column(Integer, nullable=False, index=True)
     is_palindrome = mapped_column(Boolean, nullable=False)
     unique_characters = mapped_column(Integer, nullable=False)
-    word_count = mapped_column(Integer, nullable=False)
+    word_count = mapped_column(Integer, nullable=False, index=True)
     
     character_frequency_map = mapped_column(JSONB, nullable=False)
     
@@ -22,4 +22,20 @@ class AnalyzedString(Base):
         DateTime(timezone=True), 
         server_default=func.now(), 
         nullable=False
+    )
+
+    __table_args__ = (
+        # Palindromes are a small fraction of rows, so a partial index
+        # serves is_palindrome=true far better than a boolean btree.
+        Index(
+            "ix_analyzed_strings_palindromes",
+            "is_palindrome",
+            postgresql_where=text("is_palindrome"),
+        ),
+        # Serves character_frequency_map.has_key() (the JSONB ? operator)
+        Index(
+            "ix_analyzed_strings_character_frequency_map",
+            "character_frequency_map",
+            postgresql_using="gin",
+        ),
     )
\ No newline at end of file
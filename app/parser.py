@@ -1,6 +1,131 @@
 # app/parser.py
 import re
-from typing import Dict, Any, Optional
+import string
+from typing import Dict, Any, List, Optional, Tuple
+
+# Two-token phrases followed by a number, e.g. "longer than 10"
+_NUMBER_PHRASES = {
+    ("longer", "than"): "longer_than",
+    ("more", "than"): "longer_than",
+    ("at", "least"): "at_least",
+    ("shorter", "than"): "shorter_than",
+    ("less", "than"): "shorter_than",
+    ("at", "most"): "at_most",
+}
+
+# Two-token keyword phrases
+_KEYWORD_PHRASES = {
+    ("single", "word"): "single_word",
+    ("single", "words"): "single_word",
+    ("first", "vowel"): "first_vowel",
+}
+
+_CONTAINS_TOKENS = ("contains", "containing")
+
+# Words that follow the number of a word count, e.g. "3 words"
+_WORD_TOKENS = ("word", "words")
+
+_PHRASES = {**_NUMBER_PHRASES, **_KEYWORD_PHRASES}
+_KEYWORD_PHRASE_NAMES = frozenset(_KEYWORD_PHRASES.values())
+
+# Words that can start (or, for word counts, end) a phrase; any other word
+# is skipped with one set lookup
+_PHRASE_STARTS = frozenset([first for first, _ in _PHRASES] + list(_CONTAINS_TOKENS) + list(_WORD_TOKENS))
+
+# Lookahead past the last token reaches these instead of an IndexError
+_PADDING = ["", "", ""]
+
+# Punctuation that may be attached to a word; quotes are kept for the
+# character pattern below.
+_PUNCTUATION = "".join(c for c in string.punctuation if c not in "\"'_")
+
+# Chunks with punctuation inside them are split after each run of it,
+# e.g. "z,y" -> "z,", "y"; "5-characters" -> "5-", "characters".
+_TOKEN_PATTERN = re.compile(r'[^\w\s"\']*[\w"\']+[^\w\s"\']*')
+_CHARACTER_PATTERN = re.compile(r'["\']?([a-z0-9])["\']?')
+
+def _tokenize(query: str) -> Tuple[List[str], List[str]]:
+    """
+    Returns the query's tokens and the same tokens without attached
+    punctuation, for keyword lookups.
+    """
+    chunks = query.split()
+    if "".join(chunks).isalnum():
+        return chunks, chunks
+
+    tokens: List[str] = []
+    words: List[str] = []
+    for chunk in chunks:
+        word = chunk.strip(_PUNCTUATION)
+        if word.isalnum():
+            tokens.append(chunk)
+            words.append(word)
+        else:
+            parts = _TOKEN_PATTERN.findall(chunk)
+            tokens.extend(parts)
+            words.extend(part.strip(_PUNCTUATION) for part in parts)
+    return tokens, words
+
+# Numbers may have text attached, e.g. "than 10chars". Callers check that
+# the first (or last) character is a digit.
+def _leading_number(token: str) -> int:
+    end = 1
+    while end < len(token) and token[end].isdecimal():
+        end += 1
+    return int(token[:end])
+
+def _trailing_number(token: str) -> int:
+    start = len(token) - 1
+    while start > 0 and token[start - 1].isdecimal():
+        start -= 1
+    return int(token[start:])
+
+def _find_phrases(query: str) -> Dict[str, Any]:
+    """
+    Returns the value of the first occurrence of each recognised phrase in
+    the query (True for plain keywords).
+    """
+    found: Dict[str, Any] = {}
+    if "palindrome" in query or "palindromic" in query:
+        found["palindrome"] = True
+
+    tokens, words = _tokenize(query)
+    # Padded with empty strings so lookahead needs no bounds checks
+    padded_tokens = tokens + _PADDING
+    padded_words = words + _PADDING
+
+    for i in [i for i, word in enumerate(words) if word in _PHRASE_STARTS]:
+        word = words[i]
+        following = padded_words[i + 1]
+
+        if word in _WORD_TOKENS:
+            # "<number> words"; the number must end its token ("4+ words" is not 4)
+            if i and tokens[i - 1][-1:].isdecimal():
+                found.setdefault("word_count", _trailing_number(tokens[i - 1]))
+            continue
+
+        if word in _CONTAINS_TOKENS:
+            j = i + 3 if following == "the" and padded_words[i + 2] == "letter" else i + 1
+            # Only trailing punctuation may follow the character ("z,")
+            match = _CHARACTER_PATTERN.fullmatch(padded_tokens[j].rstrip(_PUNCTUATION))
+            if match:
+                found.setdefault("contains", match.group(1))
+            continue
+
+        phrase = _PHRASES.get((word, following))
+        if phrase in _KEYWORD_PHRASE_NAMES:
+            found.setdefault(phrase, True)
+        elif phrase:
+            number = padded_words[i + 2]
+            number_token = padded_tokens[i + 2]
+            # A '-' before the number ("than -3", "than-3") makes it negative,
+            # which no length phrase accepts
+            if number[:1].isdecimal() and tokens[i + 1][-1:] != "-" and (
+                number_token == number or "-" not in number_token.partition(number)[0]
+            ):
+                found.setdefault(phrase, int(number) if number.isdecimal() else _leading_number(number))
+
+    return found
 
 def parse_natural_language_query(query: str) -> Optional[Dict[str, Any]]:
     """
@@ -10,40 +135,35 @@ def parse_natural_language_query(query: str) -> Optional[Dict[str, Any]]:
     filters: Dict[str, Any] = {}
     original_query = query
     query = query.lower().strip()
+    found = _find_phrases(query)
 
-    if "palindromic" in query or "palindrome" in query:
+    if "palindrome" in found:
         filters["is_palindrome"] = True
 
-    word_count_match = re.search(r'(\d+)\s+word(s)?', query)
-    if word_count_match:
-        filters["word_count"] = int(word_count_match.group(1))
-    elif "single word" in query:
+    if "word_count" in found:
+        filters["word_count"] = found["word_count"]
+    elif "single_word" in found:
         filters["word_count"] = 1
 
-    min_length_match = re.search(r'(longer|more)\s+than\s+(\d+)', query)
-    if min_length_match:
-        filters["min_length"] = int(min_length_match.group(2)) + 1
+    if "longer_than" in found:
+        filters["min_length"] = found["longer_than"] + 1
 
-    min_length_at_least_match = re.search(r'at\s+least\s+(\d+)', query)
-    if min_length_at_least_match:
-         filters["min_length"] = int(min_length_at_least_match.group(1))
+    if "at_least" in found:
+         filters["min_length"] = found["at_least"]
 
-    max_length_match = re.search(r'(shorter|less)\s+than\s+(\d+)', query)
-    if max_length_match:
-        filters["max_length"] = int(max_length_match.group(2)) - 1
+    if "shorter_than" in found:
+        filters["max_length"] = found["shorter_than"] - 1
         
-    max_length_at_most_match = re.search(r'at\s+most\s+(\d+)', query)
-    if max_length_at_most_match:
-         filters["max_length"] = int(max_length_at_most_match.group(1))
+    if "at_most" in found:
+         filters["max_length"] = found["at_most"]
 
-    contains_match = re.search(r'contain(s|ing)\s+(the\s+letter\s+)?["\']?([a-z0-9])["\']?', query)
-    if contains_match:
-        filters["contains_character"] = contains_match.group(3)
+    if "contains" in found:
+        filters["contains_character"] = found["contains"]
         
-    if "first vowel" in query:
+    if "first_vowel" in found:
         filters["contains_character"] = "a"
 
     if not filters:
         return None
 
-    return filters
\ No newline at end of file
+    return filters
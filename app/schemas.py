@@ -1,7 +1,7 @@
 # app/schemas.py
 from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Annotated, Dict, Any, List, Optional
 
 
 class StringProperties(BaseModel):
@@ -13,7 +13,9 @@ class StringProperties(BaseModel):
     unique_characters: int
     word_count: int
     sha256_hash: str
-    character_frequency_map: Dict[str, int]
+    character_frequency_map: Optional[Dict[str, int]] = Field(
+        None, description="Omitted (null) on list endpoints unless include=frequency is passed."
+    )
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -26,6 +28,16 @@ class StringCreate(BaseModel):
     value: str = Field(..., min_length=1, description="The string to be analyzed.")
 
 
+class BulkStringCreate(BaseModel):
+    """
+    Schema for the POST /strings/bulk request body.
+    """
+    # Capped so one INSERT stays well under PostgreSQL's bind parameter limit
+    values: List[Annotated[str, Field(min_length=1)]] = Field(
+        ..., min_length=1, max_length=1000, description="The strings to be analyzed."
+    )
+
+
 class StringResponse(BaseModel):
     """
     Schema for the POST and GET /strings/{string_value} response body.
@@ -47,6 +59,15 @@ class FilterResponse(BaseModel):
     filters_applied: Dict[str, Any]
 
 
+class BulkCreateResponse(BaseModel):
+    """
+    Schema for the POST /strings/bulk response body.
+    """
+    data: List[StringResponse]
+    count: int
+    skipped: List[str] = Field(..., description="Values that already existed and were not stored again.")
+
+
 class NLFilterParsed(BaseModel):
     """
     Schema for the 'interpreted_query.parsed_filters' part.
@@ -71,4 +92,22 @@ class NLFilterResponse(BaseModel):
     """
     data: List[StringResponse]
     count: int
-    interpreted_query: NLFilterInterpretedQuery
\ No newline at end of file
+    interpreted_query: NLFilterInterpretedQuery
+
+
+class CacheStats(BaseModel):
+    """
+    Hit/miss counters for a single in-process cache.
+    """
+    hits: int
+    misses: int
+    size: int
+    maxsize: Optional[int]
+
+
+class MetricsResponse(BaseModel):
+    """
+    Schema for the GET /metrics response.
+    """
+    analyze_cache: CacheStats
+    response_cache: CacheStats
\ No newline at end of file
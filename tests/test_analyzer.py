@@ -0,0 +1,87 @@
+# tests/test_analyzer.py
+import hashlib
+import random
+from collections import Counter
+
+from app import analyzer
+from app.analyzer import analyze_string
+
+
+def _reference_analyze(input_string: str) -> dict:
+    """
+    The original analyze_string, kept as the reference behaviour.
+    """
+    normalized_string = input_string.lower()
+    return {
+        "length": len(input_string),
+        "is_palindrome": normalized_string == normalized_string[::-1],
+        "unique_characters": len(set(input_string)),
+        "word_count": len(input_string.split()),
+        "sha256_hash": hashlib.sha256(input_string.encode('utf-8')).hexdigest(),
+        "character_frequency_map": dict(Counter(input_string)),
+    }
+
+
+def _palindrome(rng: random.Random, alphabet: str, length: int) -> str:
+    half = "".join(rng.choice(alphabet) for _ in range(length // 2))
+    middle = rng.choice(alphabet) if length % 2 else ""
+    # Mixed case on the way back, since the check ignores case
+    return half + middle + half[::-1].swapcase()
+
+
+def test_is_palindrome():
+    for value in ["", "a", "aba", "abba", b"", b"x", b"xyx"]:
+        assert analyzer._is_palindrome(value)
+    for value in ["ab", "abca", b"xy", b"xyz"]:
+        assert not analyzer._is_palindrome(value)
+
+
+def test_ends_differ():
+    assert analyzer._ends_differ(b"ab")
+    assert not analyzer._ends_differ(b"aA")
+    assert not analyzer._ends_differ(b"")
+    # '@' and '`' only differ in bit 0x20, so the probe cannot tell them
+    # apart; the full comparison after it must still reject the string.
+    assert not analyzer._ends_differ(b"@`")
+    assert analyze_string("@`")["is_palindrome"] is False
+    long_value = "@" + "a" * 2000 + "`"
+    assert analyze_string(long_value)["is_palindrome"] is False
+
+
+def test_counting_switch():
+    # Short ASCII strings are counted with Counter, long ones with numpy
+    threshold = analyzer._BINCOUNT_MIN_LENGTH
+    rng = random.Random(20261014)
+    for length in (threshold - 1, threshold, threshold + 1):
+        value = "".join(rng.choice("abcXYZ 019!~") for _ in range(length))
+        assert analyze_string(value) == _reference_analyze(value), length
+
+
+def test_long_strings():
+    rng = random.Random(20261014)
+    for length in (analyzer._PALINDROME_PROBE_MIN_LENGTH, analyzer.ANALYZE_CACHE_MAX_LENGTH + 1):
+        for value in [
+            _palindrome(rng, "abcXYZ ", length),
+            _palindrome(rng, "abcXYZ ", length) + "q",
+            "".join(rng.choice("abcXYZ ") for _ in range(length)),
+            _palindrome(rng, "aé日 ", length),
+        ]:
+            assert analyze_string(value) == _reference_analyze(value), length
+
+
+def test_cached_result_is_not_shared():
+    first = analyze_string("cache me")
+    first["character_frequency_map"]["c"] = 100
+    assert analyze_string("cache me")["character_frequency_map"]["c"] == 2
+
+
+def test_matches_reference_analyzer():
+    rng = random.Random(20261014)
+    for alphabet in ["abcAB  \t\n@`[{", "aAéÉß İı日本  "]:
+        for _ in range(5000):
+            length = rng.choice([0, 1, 2, 3, rng.randint(4, 40), rng.randint(200, 600)])
+            if rng.random() < 0.3:
+                value = _palindrome(rng, alphabet, length)
+            else:
+                value = "".join(rng.choice(alphabet) for _ in range(length))
+            assert analyze_string(value) == _reference_analyze(value), repr(value)
@@ -0,0 +1,99 @@
+# tests/test_cache.py
+from unittest import mock
+
+from app.cache import ResponseCache
+
+
+def _cache(**overrides) -> ResponseCache:
+    options = dict(maxsize=4, ttl=60, max_bytes=100, max_entry_bytes=50)
+    options.update(overrides)
+    return ResponseCache(**options)
+
+
+def test_get_and_counters():
+    cache = _cache()
+    assert cache.get("a") is None
+    entry = cache.set("a", cache.generation, b"body")
+    assert cache.get("a") is entry
+    assert entry.body == b"body"
+    assert entry.etag.startswith('"') and entry.etag.endswith('"')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_set_after_clear_is_not_stored():
+    cache = _cache()
+    generation = cache.generation
+    cache.clear()
+    entry = cache.set("a", generation, b"stale")
+    # The caller still gets an entry to respond with
+    assert entry.body == b"stale"
+    assert cache.get("a") is None
+    assert len(cache) == 0 and cache.total_bytes == 0
+
+
+def test_byte_accounting():
+    cache = _cache()
+    cache.set("a", cache.generation, b"x" * 10)
+    cache.set("b", cache.generation, b"x" * 20)
+    assert cache.total_bytes == 30
+
+    # Replacing an entry counts only the new body
+    cache.set("a", cache.generation, b"x" * 5)
+    assert cache.total_bytes == 25
+
+    cache.clear()
+    assert cache.total_bytes == 0 and len(cache) == 0
+
+
+def test_oversized_body_is_not_stored():
+    cache = _cache()
+    entry = cache.set("a", cache.generation, b"x" * 51)
+    assert entry.body == b"x" * 51
+    assert cache.get("a") is None
+    assert cache.total_bytes == 0
+
+
+def test_evicts_least_recently_used_by_count():
+    cache = _cache()
+    for key in "abcd":
+        cache.set(key, cache.generation, b"x")
+    cache.get("a")
+    cache.set("e", cache.generation, b"x")
+    assert len(cache) == 4
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.total_bytes == 4
+
+
+def test_evicts_least_recently_used_by_bytes():
+    cache = _cache()
+    cache.set("a", cache.generation, b"x" * 40)
+    cache.set("b", cache.generation, b"x" * 40)
+    cache.get("a")
+    cache.set("c", cache.generation, b"x" * 40)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.total_bytes == 80
+
+
+def test_entries_expire():
+    cache = _cache(ttl=10)
+    with mock.patch("app.cache.time.monotonic", return_value=1000.0):
+        cache.set("a", cache.generation, b"body")
+    with mock.patch("app.cache.time.monotonic", return_value=1009.0):
+        assert cache.get("a") is not None
+    with mock.patch("app.cache.time.monotonic", return_value=1010.0):
+        assert cache.get("a") is None
+    assert len(cache) == 0 and cache.total_bytes == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_if_none_match():
+    cache = _cache()
+    entry = cache.set("a", cache.generation, b"body")
+    assert entry.matches(entry.etag)
+    assert entry.matches("W/" + entry.etag)
+    assert entry.matches('"other", W/%s' % entry.etag)
+    assert entry.matches("*")
+    assert not entry.matches("")
+    assert not entry.matches('"other"')
@@ -0,0 +1,112 @@
+# tests/test_parser.py
+import random
+import re
+from typing import Any, Dict, Optional
+
+from app.parser import parse_natural_language_query
+
+
+def _reference_parse(query: str) -> Optional[Dict[str, Any]]:
+    """
+    The original regex-based parser, kept as the reference behaviour.
+
+    One deliberate difference: the "contains" character must not be followed
+    by another letter or digit. The original took the first letter of any
+    following word, so "contains least" filtered on 'l'.
+
+    A word count must be followed by "word" or "words" exactly; the
+    original regex also accepted "3 wordy".
+
+    The tokenizer is also more lenient about punctuation between the words
+    of a phrase ("than (12)", "the letter, q"), so the comparison vocabulary
+    only attaches punctuation to single words.
+    """
+    filters: Dict[str, Any] = {}
+    query = query.lower().strip()
+
+    if "palindromic" in query or "palindrome" in query:
+        filters["is_palindrome"] = True
+
+    word_count_match = re.search(r'(\d+)\s+word(s)?', query)
+    if word_count_match:
+        filters["word_count"] = int(word_count_match.group(1))
+    elif "single word" in query:
+        filters["word_count"] = 1
+
+    min_length_match = re.search(r'(longer|more)\s+than\s+(\d+)', query)
+    if min_length_match:
+        filters["min_length"] = int(min_length_match.group(2)) + 1
+
+    min_length_at_least_match = re.search(r'at\s+least\s+(\d+)', query)
+    if min_length_at_least_match:
+        filters["min_length"] = int(min_length_at_least_match.group(1))
+
+    max_length_match = re.search(r'(shorter|less)\s+than\s+(\d+)', query)
+    if max_length_match:
+        filters["max_length"] = int(max_length_match.group(2)) - 1
+
+    max_length_at_most_match = re.search(r'at\s+most\s+(\d+)', query)
+    if max_length_at_most_match:
+        filters["max_length"] = int(max_length_at_most_match.group(1))
+
+    contains_match = re.search(
+        r'contain(s|ing)\s+(the\s+letter\s+)?["\']?([a-z0-9])["\']?(?![a-z0-9])', query
+    )
+    if contains_match:
+        filters["contains_character"] = contains_match.group(3)
+
+    if "first vowel" in query:
+        filters["contains_character"] = "a"
+
+    if not filters:
+        return None
+
+    return filters
+
+
+_VOCABULARY = [
+    "at", "least", "most", "longer", "more", "less", "shorter", "than",
+    "3", "12", "0", "10chars", "5-characters", "4+", "20characters",
+    "word", "words", "contains", "containing", "the", "letter", "z", "'q'",
+    "z,y", "-3", "palindrome", "palindromic", "nonpalindromes", "single", "first",
+    "vowel", "strings", "characters", "and",
+]
+
+
+def test_examples():
+    assert parse_natural_language_query("all single word palindromic strings") == {
+        "is_palindrome": True, "word_count": 1
+    }
+    assert parse_natural_language_query("strings longer than 10 characters") == {"min_length": 11}
+    assert parse_natural_language_query("palindromic strings that contain the first vowel") == {
+        "is_palindrome": True, "contains_character": "a"
+    }
+    assert parse_natural_language_query("strings containing the letter z") == {"contains_character": "z"}
+    assert parse_natural_language_query("nothing to see here") is None
+
+
+def test_attached_numbers_and_punctuation():
+    assert parse_natural_language_query("strings longer than 10chars") == {"min_length": 11}
+    assert parse_natural_language_query("longer than 5-characters") == {"min_length": 6}
+    assert parse_natural_language_query("strings longer than 4+") == {"min_length": 5}
+    assert parse_natural_language_query("contains z,y") == {"contains_character": "z"}
+    assert parse_natural_language_query("longer than 20characters and containing z") == {
+        "min_length": 21, "contains_character": "z"
+    }
+
+
+def test_negative_numbers():
+    assert parse_natural_language_query("shorter than -3") is None
+    assert parse_natural_language_query("longer than -5") is None
+    assert parse_natural_language_query("at least -2 characters") is None
+    assert parse_natural_language_query("longer than-5") is None
+    assert parse_natural_language_query("palindromes longer than -5") == {"is_palindrome": True}
+
+
+def test_matches_reference_parser():
+    rng = random.Random(20261014)
+    for _ in range(50000):
+        query = " ".join(rng.choice(_VOCABULARY) for _ in range(rng.randint(0, 8)))
+        if rng.random() < 0.3:
+            query = query.upper()
+        assert parse_natural_language_query(query) == _reference_parse(query), query